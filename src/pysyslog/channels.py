@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from .config import ChannelConfig
 
@@ -56,12 +56,15 @@ class Channel:
         if self._closed:
             raise RuntimeError("Channel is closed")
         message = await self._queue.get()
-        message.attempts += 1
-        if self.loop is None:
-            self.loop = asyncio.get_running_loop()
-        message.last_attempt = self.loop.time()
-        self._inflight[message.id] = message
-        return message.id, message.payload
+        return self._deliver(message)
+
+    async def get_batch(self, max_items: int) -> List[tuple[int, Any]]:
+        """Wait for one message, then take up to *max_items* already queued."""
+
+        deliveries = [await self.get()]
+        while len(deliveries) < max_items and not self._queue.empty():
+            deliveries.append(self._deliver(self._queue.get_nowait()))
+        return deliveries
 
     async def ack(self, token: int) -> None:
         message = self._inflight.pop(token, None)
@@ -95,6 +98,14 @@ class Channel:
             self._queue.get_nowait()
             self._queue.task_done()
 
+    def _deliver(self, message: ChannelMessage) -> tuple[int, Any]:
+        message.attempts += 1
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        message.last_attempt = self.loop.time()
+        self._inflight[message.id] = message
+        return message.id, message.payload
+
     def _next_id(self) -> int:
         self._counter += 1
         return self._counter
@@ -106,16 +117,18 @@ class Channel:
                 if self._closed:
                     break
                 now = self.loop.time()
-                expired = [
-                    message
-                    for message in list(self._inflight.values())
-                    if now - message.last_attempt >= self.config.ack_timeout
-                ]
+                # Deliveries are inserted in the order they were handed out, so
+                # the oldest come first and the scan can stop at the first one
+                # that has not timed out yet.
+                expired = []
+                for message in self._inflight.values():
+                    if now - message.last_attempt < self.config.ack_timeout:
+                        break
+                    expired.append(message)
                 for message in expired:
+                    self._inflight.pop(message.id, None)
                     if message.attempts >= self.config.retry_limit:
-                        self._inflight.pop(message.id, None)
                         continue
-                    self._inflight.pop(message.id, None)
                     await self._queue.put(message)
         except asyncio.CancelledError:  # pragma: no cover - normal shutdown
             return
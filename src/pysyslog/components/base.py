@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import abc
 from contextlib import AbstractAsyncContextManager
-from typing import Any, Mapping, Optional
+from typing import AbstractSet, Any, Callable, List, Mapping, Optional, Sequence
 
 
 class AsyncComponent(AbstractAsyncContextManager, metaclass=abc.ABCMeta):
@@ -34,10 +34,19 @@ class InputDriver(AsyncComponent):
     async def read(self) -> Optional[str]:
         """Return the next raw log line or ``None`` if no data is available."""
 
+    async def read_batch(self, max_items: int) -> List[str]:
+        """Return up to *max_items* raw log lines, or an empty list if none are available."""
+
+        raw = await self.read()
+        return [] if raw is None else [raw]
+
 
 class Parser(AsyncComponent):
     """Convert raw input into structured dictionaries."""
 
+    #: Fields whose value is copied unchanged from the raw message.
+    verbatim_fields: AbstractSet[str] = frozenset()
+
     @abc.abstractmethod
     async def parse(self, message: str) -> Optional[Mapping[str, Any]]:
         """Parse *message* returning a dictionary or ``None`` to drop it."""
@@ -47,11 +56,38 @@ class Filter(AsyncComponent):
     """Filter structured log entries."""
 
     stage: str = "parser"
+    #: Relative evaluation cost, used when a flow reorders its filters.
+    cost: int = 1
 
     @abc.abstractmethod
     async def allow(self, record: Mapping[str, Any]) -> bool:
         """Return ``True`` if the record should continue through the pipeline."""
 
+    async def allow_many(self, records: Sequence[Mapping[str, Any]]) -> List[bool]:
+        """Return one :meth:`allow` verdict per record in *records*."""
+
+        return [await self.allow(record) for record in records]
+
+    def predicate(self) -> Optional[Callable[[Mapping[str, Any]], bool]]:
+        """Return a synchronous equivalent of :meth:`allow`, if there is one.
+
+        Filters that never need to await can expose their check here so a
+        :class:`~pysyslog.filters.chain.FilterChain` can call it directly.
+        ``None`` means :meth:`allow` must be awaited.
+        """
+
+        return None
+
+    def raw_literal(self, verbatim_fields: AbstractSet[str]) -> Optional[str]:
+        """Return text that any raw line must contain for this filter to pass.
+
+        *verbatim_fields* are the fields the parser copies unchanged from the raw
+        line. Flows use the result to reject lines before parsing them; ``None``
+        means the filter cannot be checked against the raw line.
+        """
+
+        return None
+
 
 class Output(AsyncComponent):
     """Sink for structured log records."""
@@ -60,6 +96,12 @@ class Output(AsyncComponent):
     async def write(self, record: Mapping[str, Any]) -> None:
         """Write the given record."""
 
+    async def write_many(self, records: Sequence[Any]) -> None:
+        """Write several records at once; the default calls :meth:`write` for each."""
+
+        for record in records:
+            await self.write(record)
+
 
 class OutputFormat(AsyncComponent):
     """Reusable formatting logic for outputs."""
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
-from typing import Any, Callable, Dict, Mapping, Type
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, Mapping, Tuple, Type, Union
 
 from .base import Filter, InputDriver, Output, OutputFormat, Parser
 
@@ -11,29 +13,38 @@ ComponentFactory = Callable[[Mapping[str, Any]], Any]
 
 
 class ComponentRegistry:
-    """Dynamic registry used to resolve component names."""
+    """Dynamic registry used to resolve component names.
+
+    Components may be registered as classes or as ``"module:Class"`` paths;
+    paths are imported the first time the component is created, so modules
+    for components a configuration never uses are never loaded. Third-party
+    packages can provide components through the ``pysyslog.inputs``,
+    ``pysyslog.parsers``, ``pysyslog.filters``, ``pysyslog.outputs`` and
+    ``pysyslog.formats`` entry point groups; built-in names take precedence.
+    """
 
     def __init__(self) -> None:
-        self._inputs: Dict[str, Type[InputDriver]] = {}
-        self._parsers: Dict[str, Type[Parser]] = {}
-        self._filters: Dict[str, Type[Filter]] = {}
-        self._outputs: Dict[str, Type[Output]] = {}
-        self._formats: Dict[str, Type[OutputFormat]] = {}
+        self._inputs: Dict[str, Union[Type[InputDriver], str]] = {}
+        self._parsers: Dict[str, Union[Type[Parser], str]] = {}
+        self._filters: Dict[str, Union[Type[Filter], str]] = {}
+        self._outputs: Dict[str, Union[Type[Output], str]] = {}
+        self._formats: Dict[str, Union[Type[OutputFormat], str]] = {}
         self._register_builtin()
+        self._register_entry_points()
 
-    def register_input(self, name: str, cls: Type[InputDriver]) -> None:
+    def register_input(self, name: str, cls: Union[Type[InputDriver], str]) -> None:
         self._inputs[name] = cls
 
-    def register_parser(self, name: str, cls: Type[Parser]) -> None:
+    def register_parser(self, name: str, cls: Union[Type[Parser], str]) -> None:
         self._parsers[name] = cls
 
-    def register_filter(self, name: str, cls: Type[Filter]) -> None:
+    def register_filter(self, name: str, cls: Union[Type[Filter], str]) -> None:
         self._filters[name] = cls
 
-    def register_output(self, name: str, cls: Type[Output]) -> None:
+    def register_output(self, name: str, cls: Union[Type[Output], str]) -> None:
         self._outputs[name] = cls
 
-    def register_format(self, name: str, cls: Type[OutputFormat]) -> None:
+    def register_format(self, name: str, cls: Union[Type[OutputFormat], str]) -> None:
         self._formats[name] = cls
 
     def create_input(self, type_name: str, options: Mapping[str, Any]) -> InputDriver:
@@ -52,30 +63,47 @@ class ComponentRegistry:
         return self._create(type_name, options, self._formats, "format")
 
     def available_formats(self) -> Mapping[str, Type[OutputFormat]]:
-        return dict(self._formats)
+        return {name: self._resolve(self._formats, name) for name in self._formats}
 
     def _create(
         self,
         type_name: str,
         options: Mapping[str, Any],
-        registry: Mapping[str, Type[Any]],
+        registry: Dict[str, Any],
         kind: str,
     ) -> Any:
         if type_name not in registry:
             raise KeyError(f"Unknown {kind} type '{type_name}'")
-        return registry[type_name](options)
+        return self._resolve(registry, type_name)(options)
+
+    def _resolve(self, registry: Dict[str, Any], type_name: str) -> Type[Any]:
+        cls = registry[type_name]
+        if isinstance(cls, str):
+            cls = registry[type_name] = _load_class(cls)
+        return cls
 
     def _register_builtin(self) -> None:
         for name, path in BUILTIN_INPUTS.items():
-            self.register_input(name, _load_class(path))
+            self.register_input(name, path)
         for name, path in BUILTIN_PARSERS.items():
-            self.register_parser(name, _load_class(path))
+            self.register_parser(name, path)
         for name, path in BUILTIN_FILTERS.items():
-            self.register_filter(name, _load_class(path))
+            self.register_filter(name, path)
         for name, path in BUILTIN_OUTPUTS.items():
-            self.register_output(name, _load_class(path))
+            self.register_output(name, path)
         for name, path in BUILTIN_FORMATS.items():
-            self.register_format(name, _load_class(path))
+            self.register_format(name, path)
+
+    def _register_entry_points(self) -> None:
+        registries = {
+            "inputs": self._inputs,
+            "parsers": self._parsers,
+            "filters": self._filters,
+            "outputs": self._outputs,
+            "formats": self._formats,
+        }
+        for kind, name, path in _plugin_paths():
+            registries[kind].setdefault(name, path)
 
 
 def _load_class(path: str):
@@ -84,6 +112,21 @@ def _load_class(path: str):
     return getattr(module, class_name)
 
 
+@lru_cache(maxsize=None)
+def _plugin_paths() -> Tuple[Tuple[str, str, str], ...]:
+    """Return ``(kind, name, "module:Class")`` for installed plugin components.
+
+    Reading distribution metadata is comparatively slow, so it happens once per
+    process; the classes themselves are still imported lazily.
+    """
+
+    return tuple(
+        (kind, entry_point.name, entry_point.value)
+        for kind in ("inputs", "parsers", "filters", "outputs", "formats")
+        for entry_point in entry_points(group=f"pysyslog.{kind}")
+    )
+
+
 BUILTIN_INPUTS = {
     "memory": "pysyslog.inputs.memory:MemoryInput",
 }
@@ -5,13 +5,32 @@ from __future__ import annotations
 import configparser
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterator, List, Mapping, Optional
+from typing import Dict, Iterator, List, Mapping, Optional, Union
 
 
 class ConfigError(ValueError):
     """Raised when a configuration file cannot be parsed."""
 
 
+TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+FALSE_VALUES = frozenset(("0", "false", "no", "off"))
+
+
+def parse_bool(value: Union[str, bool, None], default: bool = False) -> bool:
+    """Interpret a boolean option, raising :class:`ValueError` for unknown values."""
+
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    lowered = value.strip().lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value {value!r}")
+
+
 @dataclass(slots=True)
 class ComponentConfig:
     """Runtime description of a component declared in the INI file."""
@@ -54,6 +73,8 @@ class FlowConfig:
     format_options: Mapping[str, str] = field(default_factory=dict)
     channel: Optional[str] = None
     filters: List[FilterConfig] = field(default_factory=list)
+    reorder_filters: bool = False
+    batch_size: int = 100
 
 
 @dataclass(slots=True)
@@ -156,7 +177,9 @@ class ConfigLoader:
             if not section.startswith("flow."):
                 continue
             name = section.split(".", 1)[1]
-            cfg = parser[section]
+            # Every helper below scans the whole section; resolve it through
+            # configparser once and hand them a plain dict.
+            cfg = dict(parser.items(section))
             input_cfg = self._component_from_section(cfg, "input", section)
             parser_cfg = self._component_from_section(cfg, "parser", section)
             output_cfg = self._component_from_section(cfg, "output", section)
@@ -170,6 +193,13 @@ class ConfigLoader:
             if channel_name and channel_name not in known_channels:
                 known_channels[channel_name] = ChannelConfig(name=channel_name)
             filters = self._parse_filters(name, cfg)
+            try:
+                reorder_filters = parse_bool(cfg.get("reorder_filters"))
+                batch_size = int(cfg.get("batch_size", 100))
+            except ValueError as exc:
+                raise ConfigError(f"Invalid value in [{section}]: {exc}") from exc
+            if batch_size < 1:
+                raise ConfigError(f"batch_size in [{section}] must be at least 1")
             flows.append(
                 FlowConfig(
                     name=name,
@@ -180,6 +210,8 @@ class ConfigLoader:
                     format_options=format_options,
                     channel=channel_name,
                     filters=filters,
+                    reorder_filters=reorder_filters,
+                    batch_size=batch_size,
                 )
             )
         return flows, known_channels
@@ -1,6 +1,6 @@
 """Filter components for pysyslog."""
 
+from .chain import FilterChain
 from .field import FieldFilter
 
-__all__ = ["FieldFilter"]
-
+__all__ = ["FieldFilter", "FilterChain"]
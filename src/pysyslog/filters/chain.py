@@ -0,0 +1,90 @@
+"""Evaluate the filters of a flow stage as one unit."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Sequence
+
+from ..components.base import Filter
+
+
+class FilterChain:
+    """Run filters in sequence, stopping at the first rejection.
+
+    With ``reorder`` enabled the filters are sorted by their declared
+    :attr:`~pysyslog.components.base.Filter.cost` so cheap comparisons can
+    reject a record before expensive ones (substring, regex) are evaluated.
+    Filters of equal cost keep their configured order.
+
+    When every filter exposes a synchronous :meth:`~pysyslog.components.base.Filter.predicate`,
+    the chain fuses them into a single function and evaluates records
+    without awaiting each filter.
+    """
+
+    def __init__(self, filters: Iterable[Filter], *, reorder: bool = False) -> None:
+        self.filters: List[Filter] = list(filters)
+        if reorder:
+            self.filters.sort(key=lambda filt: filt.cost)
+        self._fused = _fuse([filt.predicate() for filt in self.filters])
+
+    def __iter__(self):
+        return iter(self.filters)
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+    async def allow(self, record: Mapping[str, Any]) -> bool:
+        if self._fused is not None:
+            return self._fused(record)
+        for filt in self.filters:
+            if not await filt.allow(record):
+                return False
+        return True
+
+    async def allow_many(self, records: Sequence[Mapping[str, Any]]) -> List[bool]:
+        """Return one verdict per record, evaluating each filter once per batch.
+
+        Each filter only sees the records every earlier filter accepted, so
+        short-circuiting is preserved while the per-record await is replaced
+        by one call per filter.
+        """
+
+        fused = self._fused
+        if fused is not None:
+            return [fused(record) for record in records]
+        verdicts = [True] * len(records)
+        pending = list(range(len(records)))
+        for filt in self.filters:
+            if not pending:
+                break
+            results = await filt.allow_many([records[index] for index in pending])
+            survivors = []
+            for index, allowed in zip(pending, results):
+                if allowed:
+                    survivors.append(index)
+                else:
+                    verdicts[index] = False
+            pending = survivors
+        return verdicts
+
+
+def _fuse(
+    predicates: List[Optional[Callable[[Mapping[str, Any]], bool]]]
+) -> Optional[Callable[[Mapping[str, Any]], bool]]:
+    """Combine *predicates* into one short-circuiting function.
+
+    Returns ``None`` when any filter has no synchronous predicate.
+    """
+
+    if not predicates or None in predicates:
+        return None
+    if len(predicates) == 1:
+        return predicates[0]
+    bound = tuple(predicates)
+
+    def fused(record: Mapping[str, Any]) -> bool:
+        for predicate in bound:
+            if not predicate(record):
+                return False
+        return True
+
+    return fused
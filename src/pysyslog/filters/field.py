@@ -4,9 +4,17 @@ from __future__ import annotations
 
 import operator
 import re
-from typing import Any, Mapping
+import sys
+from functools import lru_cache
+from typing import AbstractSet, Any, Callable, List, Mapping, Optional, Pattern, Sequence
 
 from ..components.base import Filter
+from ..config import TRUE_VALUES
+
+try:  # pragma: no cover - optional dependency
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
 
 
 OPERATORS = {
@@ -19,15 +27,26 @@ OPERATORS = {
     "contains": lambda value, candidate: candidate in value if value is not None else False,
 }
 
+OPERATOR_COSTS = {"contains": 2, "regex": 3}
+
+REGEX_ENGINES = ("re", "re2")
+
+Predicate = Callable[[Mapping[str, Any]], bool]
+
+_UNSET = object()
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
 
 class FieldFilter(Filter):
     """Filter records using configurable comparisons."""
 
     def __init__(self, config):
         super().__init__(config)
-        self.field = self.config.get("field")
-        if not self.field:
+        field_name = self.config.get("field")
+        if not field_name:
             raise ValueError("FieldFilter requires a 'field' option")
+        self.field = sys.intern(field_name)
         self.op_name = self.config.get("op", "eq")
         if self.op_name not in OPERATORS and self.op_name != "regex":
             raise ValueError(f"Unsupported filter operator '{self.op_name}'")
@@ -37,24 +56,149 @@ class FieldFilter(Filter):
             pattern = self.config.get("pattern") or self.expected
             if not pattern:
                 raise ValueError("regex filter requires 'pattern' or 'value'")
-            self.regex = re.compile(pattern)
+            engine = self.config.get("engine", "re")
+            if engine not in REGEX_ENGINES:
+                raise ValueError(f"Unsupported regex engine '{engine}'")
+            self.regex = _compile_regex(pattern, engine)
         self.stage = self.config.get("stage", "parser")
+        self.cost = OPERATOR_COSTS.get(self.op_name, 1)
+        self._predicate = _compile_predicate(self.field, self.op_name, self.expected, self.regex)
 
     async def allow(self, record: Mapping[str, Any]) -> bool:
-        value = record.get(self.field)
-        if self.op_name == "regex":
+        return self._predicate(record)
+
+    async def allow_many(self, records: Sequence[Mapping[str, Any]]) -> List[bool]:
+        predicate = self.predicate()
+        if predicate is None:
+            return await super().allow_many(records)
+        return [predicate(record) for record in records]
+
+    def predicate(self) -> Optional[Predicate]:
+        # A subclass overriding allow() must not be bypassed by callers that
+        # use the compiled predicate directly.
+        if type(self).allow is not FieldFilter.allow:
+            return None
+        return self._predicate
+
+    def raw_literal(self, verbatim_fields: AbstractSet[str]) -> Optional[str]:
+        # An overridden allow() may not agree with the configured operator.
+        if self.predicate() is None:
+            return None
+        if self.field not in verbatim_fields or self.op_name not in {"eq", "contains"}:
+            return None
+        if isinstance(self.expected, str) and self.expected:
+            return self.expected
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str, engine: str = "re") -> Pattern[str]:
+    """Compile *pattern* with the requested regex *engine*.
+
+    ``re2`` matches in linear time, so hostile or sloppy patterns cannot cause
+    catastrophic backtracking, but it lacks backreferences and lookaround and
+    treats ``\\d``, ``\\w``, ``\\s`` and ``\\b`` as ASCII-only. It is therefore
+    only used when a filter asks for it. Compiled patterns are cached so
+    filters sharing a pattern share one object.
+    """
+
+    if engine == "re2":
+        if re2 is None:
+            raise ValueError("regex engine 're2' requires the google-re2 package")
+        try:
+            return re2.compile(pattern)
+        except re2.error as exc:
+            raise ValueError(f"Pattern {pattern!r} is not supported by re2: {exc}") from exc
+    return re.compile(pattern)
+
+
+def _compile_predicate(
+    field: str, op_name: str, expected: Any, regex: Optional[Pattern[str]]
+) -> Predicate:
+    """Return a predicate with the field, operator and value bound in.
+
+    The filter configuration never changes after construction, so resolving the
+    operator once here keeps the per-record path down to a dictionary lookup
+    and a single comparison.
+    """
+
+    if op_name == "regex":
+        literal = _literal_pattern(regex.pattern)
+        if literal is not None:
+            return _compile_literal_predicate(field, *literal)
+        search = regex.search
+
+        def match_regex(record: Mapping[str, Any]) -> bool:
+            value = record.get(field)
             if value is None:
                 return False
-            return bool(self.regex.search(str(value)))
-        comparator = OPERATORS[self.op_name]
-        candidate = self._convert(self.expected, type(value))
-        return comparator(value, candidate)
+            if type(value) is not str:
+                value = str(value)
+            return search(value) is not None
 
-    def _convert(self, raw: Any, target_type: type) -> Any:
-        if raw is None:
-            return None
-        if target_type in (int, float):
-            return target_type(raw)
-        if target_type is bool:
-            return str(raw).lower() in {"1", "true", "yes"}
-        return raw
+        return match_regex
+
+    comparator = OPERATORS[op_name]
+    # Values that cannot be compared are unequal, so only ``ne`` passes them.
+    incomparable = op_name == "ne"
+    # The expected value is converted to the type of the record's value; do
+    # that once for the common types instead of on every record.
+    candidates = {}
+    for target_type in (str, int, float, bool):
+        try:
+            candidates[target_type] = _convert(expected, target_type)
+        except (TypeError, ValueError):
+            pass
+
+    def compare(record: Mapping[str, Any]) -> bool:
+        value = record.get(field)
+        candidate = candidates.get(type(value), _UNSET)
+        if candidate is _UNSET:
+            try:
+                candidate = _convert(expected, type(value))
+            except (TypeError, ValueError):
+                return incomparable
+        try:
+            return comparator(value, candidate)
+        except TypeError:
+            # Ordering between incompatible types, e.g. a missing field.
+            return incomparable
+
+    return compare
+
+
+def _literal_pattern(pattern: str) -> Optional[tuple[str, bool]]:
+    """Return ``(text, anchored)`` when *pattern* matches plain text.
+
+    Patterns such as ``ERROR`` or ``^kernel:`` need no regex engine at all: a
+    substring or prefix test gives the same answer as ``search`` for a fraction
+    of the cost. ``None`` means the pattern uses regex syntax.
+    """
+
+    anchored = pattern.startswith("^")
+    text = pattern[1:] if anchored else pattern
+    if not text or not _REGEX_METACHARACTERS.isdisjoint(text):
+        return None
+    return text, anchored
+
+
+def _compile_literal_predicate(field: str, text: str, anchored: bool) -> Predicate:
+    def match_literal(record: Mapping[str, Any]) -> bool:
+        value = record.get(field)
+        if value is None:
+            return False
+        if type(value) is not str:
+            value = str(value)
+        return value.startswith(text) if anchored else text in value
+
+    return match_literal
+
+
+def _convert(raw: Any, target_type: type) -> Any:
+    if raw is None:
+        return None
+    if target_type in (int, float):
+        return target_type(raw)
+    if target_type is bool:
+        return str(raw).strip().lower() in TRUE_VALUES
+    return raw
@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from contextlib import AsyncExitStack
-from typing import Any, Dict, List, Mapping, Optional
+from itertools import compress, repeat
+from typing import Any, Dict, List, Optional
 
 from .channels import Channel, ChannelRegistry
 from .config import ChannelConfig, FlowConfig
+from .components.base import Filter
 from .components.registry import ComponentRegistry
+from .filters.chain import FilterChain
+
+logger = logging.getLogger(__name__)
 
 
 class Flow:
@@ -33,13 +39,25 @@ class Flow:
             if config.output_format
             else None
         )
-        self._filters: Dict[str, List] = {"input": [], "parser": [], "output": []}
+        stage_filters: Dict[str, List[Filter]] = {"input": [], "parser": [], "output": []}
         for filter_config in config.filters:
             filter_instance = registry.create_filter(
                 filter_config.component.type, filter_config.component.options
             )
             filter_instance.stage = filter_config.stage
-            self._filters.setdefault(filter_config.stage, []).append(filter_instance)
+            stage_filters.setdefault(filter_config.stage, []).append(filter_instance)
+        self._filters: Dict[str, FilterChain] = {
+            stage: FilterChain(filters, reorder=config.reorder_filters)
+            for stage, filters in stage_filters.items()
+        }
+        # Literals from parser-stage filters that can be checked on the raw
+        # line, so lines that would be rejected anyway are never parsed.
+        raw_literals = []
+        for filt in self._filters["parser"]:
+            literal = filt.raw_literal(self._parser.verbatim_fields)
+            if literal is not None:
+                raw_literals.append(literal)
+        self._raw_literals = tuple(raw_literals)
 
         self._channel_owner = False
         if config.channel:
@@ -52,6 +70,7 @@ class Flow:
         self._stack: Optional[AsyncExitStack] = None
         self._running = False
         self._stop_event = asyncio.Event()
+        self._format_warned = False
 
     async def start(self) -> None:
         if self._running:
@@ -66,8 +85,8 @@ class Flow:
         await self._stack.enter_async_context(self._output)
         if self._format:
             await self._stack.enter_async_context(self._format)
-        for stage_filters in self._filters.values():
-            for filt in stage_filters:
+        for chain in self._filters.values():
+            for filt in chain:
                 await self._stack.enter_async_context(filt)
         if self._channel_owner:
             await self._stack.enter_async_context(self._channel)
@@ -96,45 +115,97 @@ class Flow:
             self._stack = None
 
     async def _ingest_loop(self) -> None:
+        # Resolve components once; the loop body runs for every message.
+        stop_event = self._stop_event
+        read_batch = self._input.read_batch
+        batch_size = self.config.batch_size
+        parse = self._parser.parse
+        put = self._channel.put
+        raw_literals = self._raw_literals
+        input_filters = self._filters["input"]
+        parser_filters = self._filters["parser"]
         try:
-            while not self._stop_event.is_set():
-                raw = await self._input.read()
-                if raw is None:
+            while not stop_event.is_set():
+                batch = await read_batch(batch_size)
+                if not batch:
                     await asyncio.sleep(0)
                     continue
-                if not await self._apply_filters("input", {"raw": raw}):
-                    continue
-                parsed = await self._parser.parse(raw)
-                if parsed is None:
-                    continue
-                if not await self._apply_filters("parser", parsed):
-                    continue
-                payload = parsed
-                rendered = await self._format.format(parsed) if self._format else parsed
-                await self._channel.put({"record": payload, "rendered": rendered})
+                if raw_literals:
+                    batch = [
+                        raw for raw in batch if all(literal in raw for literal in raw_literals)
+                    ]
+                if input_filters:
+                    verdicts = await input_filters.allow_many([{"raw": raw} for raw in batch])
+                    batch = list(compress(batch, verdicts))
+                records = []
+                for raw in batch:
+                    parsed = await parse(raw)
+                    if parsed is not None:
+                        records.append(parsed)
+                if parser_filters:
+                    records = list(compress(records, await parser_filters.allow_many(records)))
+                for parsed in records:
+                    await put({"record": parsed})
         except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
             return
 
     async def _drain_loop(self) -> None:
+        stop_event = self._stop_event
+        channel = self._channel
+        batch_size = self.config.batch_size
+        render = self._format.format if self._format else None
+        write_many = self._output.write_many
+        output_filters = self._filters["output"]
         try:
-            while not self._stop_event.is_set():
-                token, payload = await self._channel.get()
-                record = payload["record"]
-                if not await self._apply_filters("output", record):
-                    await self._channel.ack(token)
+            while not stop_event.is_set():
+                tokens: List[int] = []
+                rendered: List[Any] = []
+                batch = await channel.get_batch(batch_size)
+                records = [payload["record"] for _, payload in batch]
+                if output_filters:
+                    verdicts = await output_filters.allow_many(records)
+                else:
+                    verdicts = repeat(True)
+                for (token, _), record, allowed in zip(batch, records, verdicts):
+                    if not allowed:
+                        await channel.ack(token)
+                        continue
+                    # Render after output filtering so dropped records are
+                    # never formatted.
+                    if render is not None:
+                        try:
+                            record = await render(record)
+                        except Exception as exc:
+                            self._log_format_error(exc)
+                            await channel.ack(token)
+                            continue
+                    tokens.append(token)
+                    rendered.append(record)
+                if not tokens:
                     continue
+                # Tokens are acked once write_many returns. Outputs that buffer
+                # (StdoutOutput with flush_bytes > 0) have not written the
+                # records yet at that point.
                 try:
-                    await self._output.write(payload["rendered"])
-                except Exception:  # pragma: no cover - defensive
-                    await self._channel.nack(token)
+                    await write_many(rendered)
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.debug("Flow %s: output write failed, requeueing: %s", self.name, exc)
+                    for token in tokens:
+                        await channel.nack(token)
                     await asyncio.sleep(0)
                 else:
-                    await self._channel.ack(token)
+                    for token in tokens:
+                        await channel.ack(token)
         except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
             return
 
-    async def _apply_filters(self, stage: str, record: Mapping[str, Any]) -> bool:
-        for filt in self._filters.get(stage, []):
-            if not await filt.allow(record):
-                return False
-        return True
+    def _log_format_error(self, exc: Exception) -> None:
+        # A template typo fails every record; warn once so the flow does not
+        # flood the log, and keep the per-record detail at debug level.
+        if not self._format_warned:
+            self._format_warned = True
+            logger.warning(
+                "Flow %s: dropping records that cannot be formatted: %r", self.name, exc
+            )
+        else:
+            logger.debug("Flow %s: dropping unformattable record: %r", self.name, exc)
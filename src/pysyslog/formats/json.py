@@ -6,17 +6,21 @@ import json
 from typing import Any, Mapping
 
 from ..components.base import OutputFormat
+from ..config import parse_bool
 
 
 class JsonFormat(OutputFormat):
-    """Serialize records using :func:`json.dumps`."""
+    """Serialize records as JSON, matching :func:`json.dumps` output."""
 
     def __init__(self, config):
         super().__init__(config)
         self._indent = self.config.get("indent")
         if self._indent is not None:
             self._indent = int(self._indent)
-        self._sort_keys = self.config.get("sort_keys", "false").lower() in {"1", "true", "yes"}
+        self._sort_keys = parse_bool(self.config.get("sort_keys"))
+        # json.dumps builds a new encoder per call whenever options differ from
+        # the defaults; build ours once instead.
+        self._encode = json.JSONEncoder(indent=self._indent, sort_keys=self._sort_keys).encode
 
     async def format(self, record: Mapping[str, Any]) -> str:
-        return json.dumps(record, indent=self._indent, sort_keys=self._sort_keys)
+        return self._encode(record)
@@ -13,6 +13,9 @@ class TextFormat(OutputFormat):
     def __init__(self, config):
         super().__init__(config)
         self._template = self.config.get("template", "{message}")
+        self._render = self._template.format_map
 
     async def format(self, record: Mapping[str, object]) -> str:
-        return self._template.format(**record)
+        # format_map reads the record directly instead of copying it into
+        # keyword arguments on every call.
+        return self._render(record)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from asyncio import QueueEmpty
-from typing import Optional
+from typing import List, Optional
 
 from ..components.base import InputDriver
 
@@ -28,9 +28,26 @@ class MemoryInput(InputDriver):
         try:
             return self._queue.get_nowait()
         except QueueEmpty:
-            await asyncio.sleep(self._idle_sleep)
+            pass
+        # Block on the queue rather than sleeping so a message sent while idle
+        # is picked up immediately; ``idle_sleep`` only bounds the wait.
+        try:
+            return await asyncio.wait_for(self._queue.get(), self._idle_sleep)
+        except asyncio.TimeoutError:
             return None
 
+    async def read_batch(self, max_items: int) -> List[str]:
+        first = await self.read()
+        if first is None:
+            return []
+        batch = [first]
+        while len(batch) < max_items:
+            try:
+                batch.append(self._queue.get_nowait())
+            except QueueEmpty:
+                break
+        return batch
+
     async def stop(self) -> None:
         self._closed = True
 
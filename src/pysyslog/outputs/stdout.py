@@ -3,14 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import sys
-from typing import Any
+from itertools import chain
+from typing import Any, List, Optional, Sequence
 
 from ..components.base import Output
+from ..config import parse_bool
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+_SIZE_RE = re.compile(r"^\s*(\d+)\s*([BKMG]?)\s*$", re.IGNORECASE)
+_NEWLINE = "\n"
 
 
 class StdoutOutput(Output):
-    """Write output to the configured standard stream."""
+    """Write output to the configured standard stream.
+
+    By default every batch passed to :meth:`write_many` is written with a
+    single write/flush before the call returns. With ``flush_bytes`` above
+    zero, entries are instead buffered and written once that many characters
+    are pending, ``flush_interval`` seconds after the first pending entry, or
+    when the output stops. Buffered entries are acknowledged to the channel
+    before they reach the stream, so they are lost if the process exits
+    before the next flush.
+
+    A failed write keeps its text pending for the next flush. A failure in a
+    timed flush is raised from the next :meth:`write_many` call, unless a
+    later write has succeeded by then.
+    """
 
     def __init__(self, config):
         super().__init__(config)
@@ -18,11 +38,99 @@ class StdoutOutput(Output):
         if stream_name not in {"stdout", "stderr"}:
             raise ValueError("stream must be 'stdout' or 'stderr'")
         self._stream = getattr(sys, stream_name)
-        self._append_newline = self.config.get("newline", "true").lower() in {"1", "true", "yes"}
+        self._append_newline = parse_bool(self.config.get("newline"), True)
+        self._flush_bytes = _parse_size(self.config.get("flush_bytes", 0))
+        self._flush_interval = float(self.config.get("flush_interval", 1.0))
+        self._pending: List[str] = []
+        self._pending_size = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._timed_flush: Optional[asyncio.Task[None]] = None
+        self._flush_error: Optional[Exception] = None
 
     async def write(self, record: Any) -> None:
-        text = record if isinstance(record, str) else str(record)
-        if self._append_newline and not text.endswith("\n"):
-            text = f"{text}\n"
-        await asyncio.to_thread(self._stream.write, text)
-        await asyncio.to_thread(self._stream.flush)
+        await self.write_many((record,))
+
+    async def write_many(self, records: Sequence[Any]) -> None:
+        self._raise_flush_error()
+        batch: List[str] = []
+        size = 0
+        for record in records:
+            text = record if isinstance(record, str) else str(record)
+            batch.append(text)
+            size += len(text)
+            # Queue the shared newline as its own piece rather than building a
+            # copy of every entry; the write joins everything in one pass anyway.
+            if self._append_newline and not text.endswith(_NEWLINE):
+                batch.append(_NEWLINE)
+                size += 1
+        if self._pending_size + size >= self._flush_bytes:
+            # The caller requeues this batch if the write fails, so only the
+            # entries that were already pending are kept for a retry.
+            await self._write_pending(batch)
+            return
+        self._pending.extend(batch)
+        self._pending_size += size
+        if self._flush_timer is None:
+            loop = asyncio.get_running_loop()
+            self._flush_timer = loop.call_later(self._flush_interval, self._schedule_flush)
+
+    async def flush(self) -> None:
+        """Write all pending entries to the stream and flush it."""
+
+        await self._write_pending(())
+
+    async def stop(self) -> None:
+        if self._timed_flush is not None:
+            await self._timed_flush
+            self._timed_flush = None
+        await self.flush()
+
+    async def _write_pending(self, batch: Sequence[str]) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        async with self._flush_lock:
+            pending, self._pending = self._pending, []
+            self._pending_size = 0
+            if not pending and not batch:
+                return
+            try:
+                await asyncio.to_thread(self._write_through, "".join(chain(pending, batch)))
+            except Exception:
+                # Put the pending entries back ahead of anything queued
+                # meanwhile so the next flush retries them in order.
+                self._pending[:0] = pending
+                self._pending_size += sum(map(len, pending))
+                raise
+            # Whatever a failed timed flush left pending has now been written.
+            self._flush_error = None
+
+    def _schedule_flush(self) -> None:
+        self._flush_timer = None
+        self._timed_flush = asyncio.ensure_future(self._run_timed_flush())
+
+    async def _run_timed_flush(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exc:
+            # Nobody awaits this task; hand the error to the next caller.
+            self._flush_error = exc
+
+    def _raise_flush_error(self) -> None:
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+
+    def _write_through(self, text: str) -> None:
+        self._stream.write(text)
+        self._stream.flush()
+
+
+def _parse_size(value: str) -> int:
+    """Parse sizes such as ``4096``, ``64K`` or ``1M`` into a byte count."""
+
+    match = _SIZE_RE.match(str(value))
+    if match is None:
+        raise ValueError(f"Invalid size {value!r}")
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2).upper()]
@@ -3,9 +3,18 @@
 from __future__ import annotations
 
 import json
+import logging
 from typing import Any, Mapping, Optional
 
 from ..components.base import Parser
+from ..config import parse_bool
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 
 class JsonParser(Parser):
@@ -13,9 +22,29 @@ class JsonParser(Parser):
 
     def __init__(self, config):
         super().__init__(config)
-        self._allow_null = self.config.get("allow_null", "false").lower() in {"1", "true", "yes"}
+        self._allow_null = parse_bool(self.config.get("allow_null"))
 
     async def parse(self, message: str) -> Optional[Mapping[str, Any]]:
         if not message and not self._allow_null:
             return None
-        return json.loads(message)
+        try:
+            return _loads(message)
+        except ValueError as exc:
+            logger.debug("Dropping malformed JSON message: %s", exc)
+            return None
+
+
+def _loads(message: str) -> Any:
+    """Decode *message* with orjson when installed, falling back to :mod:`json`.
+
+    orjson is stricter than the standard library (it rejects ``NaN`` and
+    integers beyond 64 bits), so documents it refuses are retried with
+    :func:`json.loads` to keep accepting the same input either way.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(message)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(message)
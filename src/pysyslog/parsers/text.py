@@ -10,6 +10,8 @@ from ..components.base import Parser
 class TextParser(Parser):
     """Wrap the raw message in a dictionary."""
 
+    verbatim_fields = frozenset({"message"})
+
     async def parse(self, message: str) -> Optional[Mapping[str, str]]:
         if message is None:
             return None
@@ -42,3 +42,21 @@ def test_channel_ack_timeout_requeues():
         await channel.close()
 
     asyncio.run(scenario())
+
+
+def test_channel_get_batch_takes_only_queued_messages():
+    async def scenario():
+        channel = Channel(ChannelConfig(name="test", maxsize=8, ack_timeout=1, retry_limit=3))
+        await channel.start()
+        for payload in ("a", "b", "c"):
+            await channel.put(payload)
+
+        batch = await channel.get_batch(2)
+        assert [payload for _, payload in batch] == ["a", "b"]
+        batch += await channel.get_batch(2)
+        assert [payload for _, payload in batch] == ["a", "b", "c"]
+        for token, _ in batch:
+            await channel.ack(token)
+        await channel.close()
+
+    asyncio.run(scenario())
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from pysyslog.config import ConfigError, ConfigLoader
+from pysyslog.config import ConfigError, ConfigLoader, parse_bool
 
 
 def test_config_loader_parses_flows_and_channels():
@@ -41,3 +41,34 @@ filter.stage = parser
 """
     with pytest.raises(ConfigError):
         ConfigLoader().loads(text)
+
+
+def test_reorder_filters_flag():
+    text = """
+[flow.ordered]
+input.type = memory
+parser.type = text
+output.type = memory
+reorder_filters = true
+"""
+    assert ConfigLoader().loads(text).get_flow("ordered").reorder_filters is True
+
+
+def test_batch_size_must_be_positive():
+    text = """
+[flow.batched]
+input.type = memory
+parser.type = text
+output.type = memory
+batch_size = 0
+"""
+    with pytest.raises(ConfigError):
+        ConfigLoader().loads(text)
+
+
+def test_parse_bool():
+    assert parse_bool("Yes") is True
+    assert parse_bool("off") is False
+    assert parse_bool(None, True) is True
+    with pytest.raises(ValueError):
+        parse_bool("maybe")
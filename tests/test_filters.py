@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pysyslog.filters import FieldFilter, FilterChain
+
+
+def _allow(options, record):
+    return asyncio.run(FieldFilter(options).allow(record))
+
+
+@pytest.mark.parametrize(
+    "op, value, record, expected",
+    [
+        ("eq", "info", {"level": "info"}, True),
+        ("ne", "info", {"level": "info"}, False),
+        ("gt", "3", {"level": 5}, True),
+        ("le", "3", {"level": 5}, False),
+        ("eq", "2.5", {"level": 2.5}, True),
+        ("eq", "yes", {"level": True}, True),
+        ("eq", " On ", {"level": True}, True),
+        ("eq", "off", {"level": False}, True),
+        ("contains", "err", {"level": "error"}, True),
+        ("contains", "err", {}, False),
+    ],
+)
+def test_field_filter_operators(op, value, record, expected):
+    assert _allow({"field": "level", "op": op, "value": value}, record) is expected
+
+
+def test_field_filter_regex():
+    options = {"field": "message", "op": "regex", "pattern": r"^ERROR\b"}
+    assert _allow(options, {"message": "ERROR: disk full"}) is True
+    assert _allow(options, {"message": "INFO: ok"}) is False
+    assert _allow(options, {}) is False
+
+
+def test_field_filter_rejects_unknown_operator():
+    with pytest.raises(ValueError):
+        FieldFilter({"field": "level", "op": "between"})
+
+
+def test_field_filter_regex_uses_re_unless_re2_requested(monkeypatch):
+    options = {"field": "message", "op": "regex", "pattern": r"^\d+$"}
+    assert _allow(options, {"message": "\u0663"}) is True
+    with pytest.raises(ValueError):
+        FieldFilter({**options, "engine": "pcre"})
+    monkeypatch.setattr("pysyslog.filters.field.re2", None)
+    with pytest.raises(ValueError):
+        FieldFilter({**options, "engine": "re2"})
+
+
+def test_filter_chain_reorders_by_cost():
+    regex = FieldFilter({"field": "message", "op": "regex", "pattern": "ERROR"})
+    contains = FieldFilter({"field": "message", "op": "contains", "value": "disk"})
+    equals = FieldFilter({"field": "level", "op": "eq", "value": "error"})
+
+    assert FilterChain([regex, contains, equals]).filters == [regex, contains, equals]
+    chain = FilterChain([regex, contains, equals], reorder=True)
+    assert chain.filters == [equals, contains, regex]
+
+    record = {"level": "error", "message": "ERROR: disk full"}
+    assert asyncio.run(chain.allow(record)) is True
+    assert asyncio.run(chain.allow({**record, "level": "info"})) is False
+
+
+def test_field_filter_rejects_incomparable_values():
+    assert _allow({"field": "level", "op": "gt", "value": "3"}, {}) is False
+    assert _allow({"field": "level", "op": "eq", "value": "2.5"}, {"level": 2}) is False
+    assert _allow({"field": "n", "op": "ne", "value": "abc"}, {"n": 5}) is True
+    assert _allow({"field": "n", "op": "ne", "value": "2.5"}, {"n": 2}) is True
+
+
+def test_field_filter_raw_literal():
+    contains = FieldFilter({"field": "message", "op": "contains", "value": "ERROR"})
+    assert contains.raw_literal(frozenset({"message"})) == "ERROR"
+    assert contains.raw_literal(frozenset()) is None
+    regex = FieldFilter({"field": "message", "op": "regex", "pattern": "ERROR"})
+    assert regex.raw_literal(frozenset({"message"})) is None
+
+
+def test_field_filters_share_compiled_patterns():
+    first = FieldFilter({"field": "message", "op": "regex", "pattern": "disk (full|error)"})
+    second = FieldFilter({"field": "host", "op": "regex", "value": "disk (full|error)"})
+    assert first.regex is second.regex
+
+
+def test_filter_chain_allow_many():
+    equals = FieldFilter({"field": "level", "op": "eq", "value": "error"})
+    contains = FieldFilter({"field": "message", "op": "contains", "value": "disk"})
+    records = [
+        {"level": "error", "message": "disk full"},
+        {"level": "info", "message": "disk full"},
+        {"level": "error", "message": "cpu hot"},
+    ]
+    chain = FilterChain([equals, contains])
+    assert asyncio.run(chain.allow_many(records)) == [True, False, False]
+    assert asyncio.run(FilterChain([]).allow_many(records)) == [True, True, True]
+
+
+@pytest.mark.parametrize(
+    "pattern, message, expected",
+    [
+        ("disk full", "ERROR: disk full", True),
+        ("^ERROR:", "ERROR: disk full", True),
+        ("^ERROR:", "WARN: ERROR: disk full", False),
+        ("^ERROR\\b", "ERRORS", False),
+        ("disk.full", "disk-full", True),
+    ],
+)
+def test_field_filter_regex_literal_fast_path(pattern, message, expected):
+    options = {"field": "message", "op": "regex", "pattern": pattern}
+    assert _allow(options, {"message": message}) is expected
+
+
+def test_filter_chain_fuses_sync_predicates():
+    class AsyncOnly(FieldFilter):
+        async def allow(self, record):
+            return await super().allow(record)
+
+    equals = FieldFilter({"field": "level", "op": "eq", "value": "error"})
+    contains = FieldFilter({"field": "message", "op": "contains", "value": "disk"})
+    fused = FilterChain([equals, contains])
+    async_only = AsyncOnly({"field": "message", "op": "contains", "value": "disk"})
+    unfused = FilterChain([equals, async_only])
+    assert fused._fused is not None
+    assert unfused._fused is None
+
+    records = [{"level": "error", "message": "disk full"}, {"level": "error", "message": "ok"}]
+    for chain in (fused, unfused):
+        assert asyncio.run(chain.allow_many(records)) == [True, False]
+        assert asyncio.run(chain.allow(records[0])) is True
+
+
+def test_filter_chain_honours_overridden_allow():
+    class RejectAll(FieldFilter):
+        async def allow(self, record):
+            return False
+
+    reject = RejectAll({"field": "level", "op": "eq", "value": "error"})
+    record = {"level": "error"}
+    assert reject.predicate() is None
+    assert asyncio.run(FilterChain([reject]).allow(record)) is False
+    assert asyncio.run(FilterChain([reject]).allow_many([record])) == [False]
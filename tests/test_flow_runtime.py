@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 
 from pysyslog.channels import ChannelRegistry
 from pysyslog.components.registry import ComponentRegistry
 from pysyslog.config import ConfigLoader
+from pysyslog.filters import FieldFilter
 from pysyslog.flow import Flow
+from pysyslog.formats.text import TextFormat
 from pysyslog.outputs.memory import MemoryOutput
+from pysyslog.outputs.stdout import StdoutOutput
 
 
 def test_flow_processes_messages_with_filters():
@@ -82,3 +86,190 @@ format.template = {message}
             await flow.stop()
 
     asyncio.run(scenario())
+
+
+class NotContainsFilter(FieldFilter):
+    async def allow(self, record):
+        return not await super().allow(record)
+
+
+def test_flow_skips_prefilter_for_filters_overriding_allow():
+    text = """
+[flow.inverted]
+input.type = memory
+parser.type = text
+output.type = memory
+filter.quiet.type = not_contains
+filter.quiet.field = message
+filter.quiet.op = contains
+filter.quiet.value = DEBUG
+"""
+    config = ConfigLoader().loads(text)
+    registry = ComponentRegistry()
+    registry.register_filter("not_contains", NotContainsFilter)
+    flow = Flow(config.get_flow("inverted"), registry, ChannelRegistry(config.channels))
+    assert flow._raw_literals == ()  # type: ignore[attr-defined]
+
+    async def scenario():
+        await flow.start()
+        try:
+            memory_input = flow._input  # type: ignore[attr-defined]
+            memory_output = flow._output  # type: ignore[attr-defined]
+            await memory_input.send("DEBUG noisy")
+            await memory_input.send("INFO hello")
+            await asyncio.sleep(0.1)
+            assert memory_output.records == [{"message": "INFO hello"}]
+        finally:
+            await flow.stop()
+
+    asyncio.run(scenario())
+
+
+class FlakyBufferedOutput(StdoutOutput):
+    def __init__(self, config):
+        super().__init__(config)
+        self.written = []
+        self._failed = False
+
+    def _write_through(self, text):
+        if not self._failed:
+            self._failed = True
+            raise OSError("simulated failure")
+        self.written.append(text)
+
+
+def test_flow_keeps_buffered_records_when_output_write_fails():
+    text = """
+[flow.buffered]
+input.type = memory
+parser.type = json
+output.type = flaky_buffered
+output.format = text
+output.flush_bytes = 10
+output.flush_interval = 60
+format.template = {message}
+"""
+    config = ConfigLoader().loads(text)
+    registry = ComponentRegistry()
+    registry.register_output("flaky_buffered", FlakyBufferedOutput)
+    flow = Flow(config.get_flow("buffered"), registry, ChannelRegistry(config.channels))
+
+    async def scenario():
+        await flow.start()
+        try:
+            memory_input = flow._input  # type: ignore[attr-defined]
+            output = flow._output  # type: ignore[attr-defined]
+            # The first record is buffered and acknowledged; the second one
+            # triggers a write that fails and is requeued by the drain loop.
+            await memory_input.send('{"message": "acked1"}')
+            await asyncio.sleep(0.05)
+            await memory_input.send('{"message": "batch2"}')
+            await asyncio.sleep(0.2)
+            assert output.written == ["acked1\nbatch2\n"]
+        finally:
+            await flow.stop()
+
+    asyncio.run(scenario())
+
+
+def test_flow_prefilters_raw_lines_before_parsing():
+    text = """
+[flow.pushdown]
+input.type = memory
+parser.type = text
+output.type = memory
+filter.errors.type = field
+filter.errors.field = message
+filter.errors.op = contains
+filter.errors.value = ERROR
+"""
+    config = ConfigLoader().loads(text)
+    flow = Flow(config.get_flow("pushdown"), ComponentRegistry(), ChannelRegistry(config.channels))
+    assert flow._raw_literals == ("ERROR",)  # type: ignore[attr-defined]
+
+    async def scenario():
+        await flow.start()
+        try:
+            memory_input = flow._input  # type: ignore[attr-defined]
+            memory_output = flow._output  # type: ignore[attr-defined]
+            await memory_input.send("INFO all good")
+            await memory_input.send("ERROR disk full")
+            await asyncio.sleep(0.1)
+            assert memory_output.records == [{"message": "ERROR disk full"}]
+        finally:
+            await flow.stop()
+
+    asyncio.run(scenario())
+
+
+class CountingFormat(TextFormat):
+    calls = 0
+
+    async def format(self, record):
+        CountingFormat.calls += 1
+        return await super().format(record)
+
+
+def test_flow_formats_only_records_passing_output_filters():
+    text = """
+[flow.render]
+input.type = memory
+parser.type = json
+output.type = memory
+output.format = counting
+format.template = {message}
+filter.keep.type = field
+filter.keep.field = level
+filter.keep.value = info
+filter.keep.stage = output
+"""
+    config = ConfigLoader().loads(text)
+    registry = ComponentRegistry()
+    registry.register_format("counting", CountingFormat)
+    flow = Flow(config.get_flow("render"), registry, ChannelRegistry(config.channels))
+
+    async def scenario():
+        await flow.start()
+        try:
+            memory_input = flow._input  # type: ignore[attr-defined]
+            memory_output = flow._output  # type: ignore[attr-defined]
+            await memory_input.send('{"message": "kept", "level": "info"}')
+            await memory_input.send('{"message": "dropped", "level": "debug"}')
+            await asyncio.sleep(0.1)
+            assert memory_output.records == ["kept"]
+            assert CountingFormat.calls == 1
+        finally:
+            await flow.stop()
+
+    asyncio.run(scenario())
+
+
+def test_flow_warns_once_about_unformattable_records(caplog):
+    text = """
+[flow.typo]
+input.type = memory
+parser.type = json
+output.type = memory
+output.format = text
+format.template = {msg}
+"""
+    config = ConfigLoader().loads(text)
+    flow = Flow(config.get_flow("typo"), ComponentRegistry(), ChannelRegistry(config.channels))
+
+    async def scenario():
+        await flow.start()
+        try:
+            memory_input = flow._input  # type: ignore[attr-defined]
+            memory_output = flow._output  # type: ignore[attr-defined]
+            await memory_input.send('{"message": "a"}')
+            await memory_input.send('{"message": "b"}')
+            await asyncio.sleep(0.1)
+            assert memory_output.records == []
+        finally:
+            await flow.stop()
+
+    with caplog.at_level(logging.INFO, logger="pysyslog.flow"):
+        asyncio.run(scenario())
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "typo" in warnings[0].getMessage()
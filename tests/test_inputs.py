@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+
+from pysyslog.inputs.memory import MemoryInput
+
+
+def test_memory_input_wakes_on_send():
+    async def scenario():
+        memory_input = MemoryInput({"idle_sleep": "5"})
+        reader = asyncio.create_task(memory_input.read())
+        await asyncio.sleep(0.01)
+        await memory_input.send("hello")
+        assert await asyncio.wait_for(reader, 1) == "hello"
+
+    asyncio.run(scenario())
+
+
+def test_memory_input_returns_none_when_idle():
+    async def scenario():
+        memory_input = MemoryInput({"idle_sleep": "0.01"})
+        assert await memory_input.read() is None
+
+    asyncio.run(scenario())
+
+
+def test_memory_input_read_batch():
+    async def scenario():
+        memory_input = MemoryInput({"messages": "a\nb\nc", "idle_sleep": "0.01"})
+        assert await memory_input.read_batch(2) == ["a", "b"]
+        assert await memory_input.read_batch(2) == ["c"]
+        assert await memory_input.read_batch(2) == []
+
+    asyncio.run(scenario())
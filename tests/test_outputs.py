@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+
+import pytest
+
+from pysyslog.formats.json import JsonFormat
+from pysyslog.outputs.stdout import StdoutOutput
+
+
+def test_stdout_output_buffers_until_stop(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stream)
+
+    async def scenario():
+        output = StdoutOutput({"flush_bytes": "256K", "flush_interval": "60"})
+        await output.write("first")
+        await output.write("second")
+        assert stream.getvalue() == ""
+        await output.stop()
+
+    asyncio.run(scenario())
+    assert stream.getvalue() == "first\nsecond\n"
+
+
+def test_stdout_output_flushes_on_size_and_interval(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stream)
+
+    async def scenario():
+        output = StdoutOutput({"flush_bytes": "8", "flush_interval": "0.01"})
+        await output.write("0123456789")
+        assert stream.getvalue() == "0123456789\n"
+        await output.write("tail")
+        await asyncio.sleep(0.05)
+        assert stream.getvalue() == "0123456789\ntail\n"
+        await output.stop()
+
+    asyncio.run(scenario())
+
+
+class FailingStream(io.StringIO):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+
+    def write(self, text):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("stream unavailable")
+        return super().write(text)
+
+
+def test_stdout_output_writes_each_batch_by_default(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stream)
+
+    async def scenario():
+        output = StdoutOutput({})
+        await output.write_many(["first", "second"])
+        assert stream.getvalue() == "first\nsecond\n"
+
+    asyncio.run(scenario())
+
+
+def test_stdout_output_keeps_pending_entries_when_a_write_fails(monkeypatch):
+    stream = FailingStream(failures=1)
+    monkeypatch.setattr("sys.stdout", stream)
+
+    async def scenario():
+        output = StdoutOutput({"flush_bytes": "10", "flush_interval": "60"})
+        await output.write("acked1")
+        with pytest.raises(OSError):
+            await output.write("batch2")
+        # The failed batch is left to the caller to retry; the entry that was
+        # already pending is written by the next flush.
+        await output.write("batch2")
+
+    asyncio.run(scenario())
+    assert stream.getvalue() == "acked1\nbatch2\n"
+
+
+def test_stdout_output_reports_timed_flush_failures(monkeypatch):
+    stream = FailingStream(failures=1)
+    monkeypatch.setattr("sys.stdout", stream)
+
+    async def scenario():
+        output = StdoutOutput({"flush_bytes": "1K", "flush_interval": "0.01"})
+        await output.write("acked1")
+        await asyncio.sleep(0.05)
+        with pytest.raises(OSError):
+            await output.write("next")
+        await output.stop()
+
+    asyncio.run(scenario())
+    assert stream.getvalue() == "acked1\n"
+
+
+def test_stdout_output_clears_timed_flush_failure_after_a_successful_write(monkeypatch):
+    stream = FailingStream(failures=1)
+    monkeypatch.setattr("sys.stdout", stream)
+
+    async def scenario():
+        output = StdoutOutput({"flush_bytes": "1K", "flush_interval": "0.01"})
+        await output.write("a")
+        await asyncio.sleep(0.05)
+        await output.stop()
+
+    asyncio.run(scenario())
+    assert stream.getvalue() == "a\n"
+
+
+def test_json_format_matches_json_dumps():
+    record = {"b": 1, "a": [1, 2], "message": "café"}
+    for options in ({}, {"indent": "2"}, {"sort_keys": "true"}):
+        fmt = JsonFormat(options)
+        expected = json.dumps(
+            record,
+            indent=int(options["indent"]) if "indent" in options else None,
+            sort_keys="sort_keys" in options,
+        )
+        assert asyncio.run(fmt.format(record)) == expected
+
+
+def test_stdout_output_parses_flush_size():
+    assert StdoutOutput({"flush_bytes": "64K"})._flush_bytes == 64 * 1024
+    assert StdoutOutput({"flush_bytes": "0"})._flush_bytes == 0
+    with pytest.raises(ValueError):
+        StdoutOutput({"flush_bytes": "lots"})
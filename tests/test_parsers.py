@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import asyncio
+
+from pysyslog.parsers.json import JsonParser
+
+
+def test_json_parser_drops_malformed_lines():
+    parser = JsonParser({})
+    assert asyncio.run(parser.parse('{"message": "ok"}')) == {"message": "ok"}
+    assert asyncio.run(parser.parse('{"message": ')) is None
+
+
+def test_json_parser_accepts_non_standard_numbers():
+    parsed = asyncio.run(JsonParser({}).parse('{"value": NaN, "big": 18446744073709551616}'))
+    assert parsed["value"] != parsed["value"]
+    assert parsed["big"] == 2**64
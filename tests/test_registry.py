@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from pysyslog.components.registry import ComponentRegistry, _plugin_paths
+from pysyslog.outputs.memory import MemoryOutput
+
+
+def test_registry_resolves_component_paths_lazily():
+    path = "pysyslog.outputs.memory:MemoryOutput"
+    registry = ComponentRegistry()
+    registry.register_output("lazy", path)
+    assert registry._outputs["lazy"] == path  # type: ignore[attr-defined]
+
+    output = registry.create_output("lazy", {})
+    assert isinstance(output, MemoryOutput)
+    assert registry._outputs["lazy"] is MemoryOutput  # type: ignore[attr-defined]
+
+
+def test_registry_rejects_unknown_types():
+    with pytest.raises(KeyError):
+        ComponentRegistry().create_parser("missing", {})
+
+
+@pytest.fixture
+def fake_plugins(monkeypatch):
+    plugins = {
+        "pysyslog.outputs": [
+            EntryPoint("plugin", "pysyslog.outputs.memory:MemoryOutput", "pysyslog.outputs"),
+            EntryPoint("memory", "pysyslog.outputs.stdout:StdoutOutput", "pysyslog.outputs"),
+        ],
+    }
+    monkeypatch.setattr(
+        "pysyslog.components.registry.entry_points",
+        lambda group: plugins.get(group, []),
+    )
+    _plugin_paths.cache_clear()
+    yield
+    _plugin_paths.cache_clear()
+
+
+def test_registry_discovers_entry_point_plugins(fake_plugins):
+    registry = ComponentRegistry()
+    outputs = registry._outputs  # type: ignore[attr-defined]
+    assert outputs["plugin"] == "pysyslog.outputs.memory:MemoryOutput"
+    assert isinstance(registry.create_output("plugin", {}), MemoryOutput)
+    assert outputs["plugin"] is MemoryOutput
+    # Built-in components win over plugins registering the same name.
+    assert isinstance(registry.create_output("memory", {}), MemoryOutput)
+
+
+def test_registry_plugin_cache_is_reset_after_fake_plugins():
+    assert ("outputs", "plugin", "pysyslog.outputs.memory:MemoryOutput") not in _plugin_paths()
+    assert "plugin" not in ComponentRegistry()._outputs  # type: ignore[attr-defined]